@@ -1,18 +1,26 @@
 """ClevererSpa Integration"""
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from logging import getLogger
+from typing import Any
 
+import aiohttp
 import async_timeout
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .clevererspa import CleverSpaApi, CleverSpaDeviceReport
+from .clevererspa import (
+    CleverSpaApi,
+    CleverSpaDevice,
+    CleverSpaDeviceReport,
+    CleverSpaDeviceStatus,
+)
 from .const import (
     CONF_API_ROOT,
     CONF_API_ROOT_EU,
@@ -39,7 +47,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     user_token = entry.data.get(CONF_USER_TOKEN)
     user_token_expiry = entry.data.get(CONF_USER_TOKEN_EXPIRY)
 
-    session = async_get_clientsession(hass)
+    # Use a dedicated session rather than HA's shared one so that keep-alive
+    # connections to the API survive between polls, avoiding a fresh TLS
+    # handshake every refresh. A single connection per host means the
+    # concurrent per-device polls are serialised over one warm socket
+    # instead of each opening their own.
+    session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=10,
+            limit_per_host=1,
+            keepalive_timeout=75,
+            ttl_dns_cache=300,
+        )
+    )
 
     if user_token:
         _LOGGER.info("Reusing existing access token")
@@ -50,6 +70,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 session, username, password
             )
         except Exception as ex:  # pylint: disable=broad-except
+            await session.close()
             raise ConfigEntryNotReady from ex
         user_token = token.user_token
         user_token_expiry = token.expiry
@@ -65,9 +86,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     api = CleverSpaApi(session, user_token, api_root)
     coordinator = CleverSpaUpdateCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        await session.close()
+        raise
 
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    hass.data[DOMAIN][f"{entry.entry_id}_session"] = session
     await hass.config_entries.async_forward_entry_setups(entry, _PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
@@ -81,6 +107,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     )
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        session = hass.data[DOMAIN].pop(f"{entry.entry_id}_session", None)
+        if session:
+            await session.close()
 
     return unload_ok
 
@@ -121,9 +150,70 @@ class CleverSpaUpdateCoordinator(DataUpdateCoordinator[dict[str, CleverSpaDevice
             _LOGGER,
             name="CleverSpa API",
             update_interval=timedelta(seconds=30),
+            # Coalesce bursts of user actions (e.g. nudging the target
+            # temperature) into a single poll.
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=0.35, immediate=False
+            ),
         )
         self.api = api
 
+        # Per-device (device, status) pairs, rebuilt in place on every update
+        # so entities can hold a reference to the dict and avoid walking
+        # coordinator.data on each property read.
+        self.status_by_id: dict[
+            str, tuple[CleverSpaDevice, CleverSpaDeviceStatus]
+        ] = {}
+
+        # Pending control writes per device, merged and flushed once per
+        # event-loop tick so that e.g. a scene toggling filter and bubbles
+        # together costs a single control call.
+        self._pending_writes: dict[str, dict[str, Any]] = {}
+        self._flush_handle: asyncio.Handle | None = None
+
+    @callback
+    def queue_write(self, device_id: str, field: str, value: Any) -> None:
+        """Queue a field write, merging it with others made in the same tick."""
+        self._pending_writes.setdefault(device_id, {})[field] = value
+        if self._flush_handle is None:
+            # Defer creating the flush task to the end of the tick via
+            # call_soon. The handle - not a side effect of the task itself -
+            # tracks whether a flush is pending, so this stays correct
+            # whether or not async_create_task starts tasks eagerly.
+            self._flush_handle = self.hass.loop.call_soon(self._start_flush)
+
+    @callback
+    def _start_flush(self) -> None:
+        """Begin flushing the writes queued during the last tick."""
+        self._flush_handle = None
+        self.hass.async_create_task(self._async_flush_writes())
+
+    async def _async_flush_writes(self) -> None:
+        """Send the queued writes, one control call per device."""
+        pending, self._pending_writes = self._pending_writes, {}
+
+        for device_id, fields in pending.items():
+            try:
+                new_status = await self.api.set_state(device_id, **fields)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Failed to write state to device %s", device_id)
+                continue
+            report = self.data.get(device_id)
+            if report is None:
+                # The device was dropped by a bindings refresh while its
+                # entities were still registered; the next poll settles it
+                _LOGGER.warning(
+                    "Discarding state update for unknown device %s", device_id
+                )
+                continue
+            self.data[device_id] = CleverSpaDeviceReport(report.device, new_status)
+            self.status_by_id[device_id] = (report.device, new_status)
+
+        self.async_set_updated_data(self.data)
+
+        # Reconcile with the server via the debounced refresh
+        await self.async_request_refresh()
+
     async def _async_update_data(self) -> dict[str, CleverSpaDeviceReport]:
         """Fetch data from API endpoint.
         This is the place to pre-process the data to lookup tables
@@ -132,7 +222,13 @@ class CleverSpaUpdateCoordinator(DataUpdateCoordinator[dict[str, CleverSpaDevice
         try:
             async with async_timeout.timeout(10):
                 await self.api.refresh_bindings()
-                return await self.api.fetch_data()
+                data = await self.api.fetch_data()
+                self.status_by_id.clear()
+                self.status_by_id.update(
+                    (did, (report.device, report.status))
+                    for did, report in data.items()
+                )
+                return data
         except Exception as err:
             _LOGGER.exception("Data update failed")
             raise UpdateFailed(f"Error communicating with API: {err}") from err
@@ -1,6 +1,7 @@
 """Binary sensor platform."""
 from __future__ import annotations
 
+import sys
 from typing import Any, Mapping
 
 from homeassistant.components.binary_sensor import (
@@ -54,7 +55,7 @@ class CleverSpaBinarySensor(CleverSpaEntity, BinarySensorEntity):
         super().__init__(coordinator, config_entry, device_id)
         self.entity_description = description
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-        self._attr_unique_id = f"{device_id}_{description.key}"
+        self._attr_unique_id = sys.intern(f"{device_id}_{description.key}")
 
 
 class CleverSpaConnectivitySensor(CleverSpaBinarySensor):
@@ -1,5 +1,5 @@
 """CleverSpa API."""
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum, auto
 from logging import getLogger
 from time import time
@@ -8,8 +8,8 @@ import asyncio
 
 from aiohttp import ClientResponse, ClientSession
 import async_timeout
-import requests
-from .const import GOOGLE_AUTH_URL, GOOGLE_AUTH_KEY, FIREBASE_DB
+import orjson
+from .const import COOLDOWN_TIME, GOOGLE_AUTH_URL, GOOGLE_AUTH_KEY, FIREBASE_DB
 
 _LOGGER = getLogger(__name__)
 _HEADERS = {
@@ -21,6 +21,21 @@ _TIMEOUT = 10
 # How old the latest update can be before a spa is considered offline
 _CONNECTIVITY_TIMEOUT = 1000
 
+# Maps CleverSpaDeviceStatus field names to the attribute names understood
+# by the control endpoint
+_CONTROL_ATTRS = {
+    "heat_power": "Heater",
+    "filter_power": "Filter",
+    "bubble_power": "Bubble",
+    "locked": "locked",
+    "temp_set": "Temperature_setup",
+}
+
+# How long the device bindings list is cached before being refetched.
+# Devices are added/removed from accounts rarely, so there is no need to
+# hit the bindings endpoint on every coordinator tick.
+_BINDINGS_TTL = 600
+
 
 class TemperatureUnit(Enum):
     """Temperature units supported by the spa."""
@@ -29,7 +44,7 @@ class TemperatureUnit(Enum):
     FAHRENHEIT = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class CleverSpaDevice:
     """A device under a user's account."""
 
@@ -38,7 +53,7 @@ class CleverSpaDevice:
     product_name: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CleverSpaDeviceStatus:
     """A snapshot of the status of a device."""
 
@@ -51,6 +66,7 @@ class CleverSpaDeviceStatus:
     bubble_power: bool
     filter_age: int
     errors: list[int]
+    locked: bool = False
 
     @property
     def online(self) -> bool:
@@ -58,7 +74,7 @@ class CleverSpaDeviceStatus:
         return self.timestamp > (time() - _CONNECTIVITY_TIMEOUT)
 
 
-@dataclass
+@dataclass(slots=True)
 class CleverSpaUserToken:
     """User authentication token, obtained (and ideally stored) following a successful login."""
 
@@ -67,7 +83,7 @@ class CleverSpaUserToken:
     expiry: int
 
 
-@dataclass
+@dataclass(slots=True)
 class CleverSpaDeviceReport:
     """A device report, which combines device metadata with a current status snapshot."""
 
@@ -98,9 +114,6 @@ class CleverSpaUserDoesNotExistException(CleverSpaAuthException):
 class CleverSpaIncorrectPasswordException(CleverSpaAuthException):
     """Password is incorrect."""
 
-class AuthError(Exception):
-    """Base exception for auth errors"""
-
 
 async def raise_for_status(response: ClientResponse) -> None:
     """Raise an exception based on the response."""
@@ -135,8 +148,13 @@ class CleverSpaApi:
         self._user_token = user_token
         self._api_root = api_root
 
+        # Merged header dict including the user token, built once here and
+        # rebuilt only when the token is rotated.
+        self._auth_headers = {**_HEADERS, "X-Gizwits-User-token": user_token}
+
         # Maps device IDs to device info
         self._bindings: dict[str, CleverSpaDevice] | None = None
+        self._bindings_refreshed_at: float = 0.0
 
         # Cache containing state information for each device received from the API
         # This is used to work around an annoyance where changes to settings via
@@ -147,26 +165,28 @@ class CleverSpaApi:
         # more recent than the local update.
         self._local_state_cache: dict[str, CleverSpaDeviceStatus] = {}
 
+        # Reports handed to the coordinator, reused between polls whenever
+        # neither the device info nor its status snapshot has changed
+        self._local_report_cache: dict[str, CleverSpaDeviceReport] = {}
 
-    async def login(self, email, password):
-        try:
-            user = requests.post(
-                GOOGLE_AUTH_URL,
-                params={"key": GOOGLE_AUTH_KEY},
-                json={"email": email, "password": password, "returnSecureToken": True},
-            ).json()
-        except requests.exceptions.HTTPError as e:
-            e = e.response.json()
-            raise AuthError(e["error"]["message"])
-        try:
-            info = requests.get(
-                f"{FIREBASE_DB}/users/{user['localId']}.json",
-                params={"auth": user["idToken"]},
-            ).json()
-        except requests.exceptions.HTTPError as e:
-            e = e.response.json()
-            raise AuthError(e["error"]["message"])
-        return dict(info)
+        # Per-device locks ensuring overlapping control calls can't
+        # interleave their POSTs and cache updates
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    def _device_lock(self, device_id: str) -> asyncio.Lock:
+        """Get (or create) the lock serialising control calls for a device."""
+        return self._locks.setdefault(device_id, asyncio.Lock())
+
+    @property
+    def user_token(self) -> str:
+        """The current user token."""
+        return self._user_token
+
+    @user_token.setter
+    def user_token(self, user_token: str) -> None:
+        """Update the user token and rebuild the cached auth headers."""
+        self._user_token = user_token
+        self._auth_headers = {**_HEADERS, "X-Gizwits-User-token": user_token}
 
     @staticmethod
     # TODO: This needs to change to the CleverSpa AUTH method
@@ -184,38 +204,53 @@ class CleverSpaApi:
                 json={"email": username, "password": password, "returnSecureToken": True},
             )
             await raise_for_status(user)
-            user_json: dict[str, Any] = await user.json(content_type=None)
+            user_json: dict[str, Any] = await user.json(
+                loads=orjson.loads, content_type=None
+            )
 
             info = await session.get(
                 f"{FIREBASE_DB}/users/{user_json['localId']}.json",
                 params={"auth": user_json["idToken"]},
             )
             info.raise_for_status()
-            info_json: dict[str, Any] = await info.json(content_type=None)
+            info_json: dict[str, Any] = await info.json(
+                loads=orjson.loads, content_type=None
+            )
 
         return CleverSpaUserToken(
             info_json["uid"], info_json["token"], info_json["expire_at"]
         )
 
-    async def refresh_bindings(self) -> None:
-        """Refresh and store the list of devices available in the account."""
+    async def refresh_bindings(self, force: bool = False) -> None:
+        """
+        Refresh and store the list of devices available in the account.
+        The list is cached for _BINDINGS_TTL seconds; pass force=True to
+        bypass the cache (e.g. after a config entry reload).
+        """
+        if (
+            not force
+            and self._bindings is not None
+            and time() - self._bindings_refreshed_at < _BINDINGS_TTL
+        ):
+            return
+
+        api_data = await self._do_get(
+            f"{self._api_root}/app/bindings", self._auth_headers
+        )
         self._bindings = {
-            device.device_id: device for device in await self._get_bindings()
+            raw["did"]: CleverSpaDevice(
+                raw["did"], raw["dev_alias"], raw["product_name"]
+            )
+            for raw in api_data["devices"]
         }
+        self._bindings_refreshed_at = time()
 
-    async def _get_bindings(self) -> list[CleverSpaDevice]:
-        """Get the list of devices available in the account."""
-        headers = dict(_HEADERS)
-        headers["X-Gizwits-User-token"] = self._user_token
-        api_data = await self._do_get(f"{self._api_root}/app/bindings", headers)
-        return list(
-            map(
-                lambda raw: CleverSpaDevice(
-                    raw["did"], raw["dev_alias"], raw["product_name"]
-                ),
-                api_data["devices"],
-            )
+    async def _fetch_one(self, did: str) -> tuple[str, dict[str, Any]]:
+        """Fetch the latest data for a single device."""
+        latest_data = await self._do_get(
+            f"{self._api_root}/app/devdata/{did}/latest", _HEADERS
         )
+        return did, latest_data
 
     async def fetch_data(self) -> dict[str, CleverSpaDeviceReport]:
         """Fetch the latest data for all devices."""
@@ -225,25 +260,28 @@ class CleverSpaApi:
         if not self._bindings:
             return results
 
-        for did, device_info in self._bindings.items():
-            latest_data = await self._do_get(
-                f"{self._api_root}/app/devdata/{did}/latest", _HEADERS
-            )
+        # Issue all requests concurrently so the total latency is one round
+        # trip rather than one per device.
+        raw = await asyncio.gather(
+            *(self._fetch_one(did) for did in self._bindings),
+            return_exceptions=True,
+        )
 
-            # Work out whether the received API update is more recent than the
-            # locally cached state
-            api_update_timestamp = latest_data["updated_at"]
-            local_update_timestamp = 0
-            if cached_state := self._local_state_cache.get(did):
-                local_update_timestamp = cached_state.timestamp
+        for result in raw:
+            if isinstance(result, BaseException):
+                raise result
+            did, latest_data = result
+            device_info = self._bindings[did]
 
-            # If the API timestamp is more recent, update the cache
-            if api_update_timestamp >= local_update_timestamp:
+            # Only build a new status when the API update is strictly more
+            # recent than the locally cached state
+            cached = self._local_state_cache.get(did)
+            if latest_data["updated_at"] > (cached.timestamp if cached else -1):
                 _LOGGER.debug("New data received for device %s", did)
                 device_attrs = latest_data["attr"]
 
                 errors = []
-                device_status = CleverSpaDeviceStatus(
+                cached = CleverSpaDeviceStatus(
                     latest_data["updated_at"],
                     device_attrs["Current_temperature"],
                     device_attrs["Temperature_setup"],
@@ -255,107 +293,166 @@ class CleverSpaApi:
                     device_attrs["Bubble"] == 1,
                     device_attrs["Time_filter"] == 0,
                     errors,
+                    locked=device_attrs.get("locked", 0) == 1,
                 )
 
-                self._local_state_cache[did] = device_status
+                self._local_state_cache[did] = cached
 
             else:
                 _LOGGER.debug(
                     "Ignoring update for device %s as local data is newer", did
                 )
 
-            results[did] = CleverSpaDeviceReport(
-                device_info,
-                self._local_state_cache[did],
-            )
+            # Reuse the previous report unless either half has changed, so
+            # the common no-update path allocates nothing
+            report = self._local_report_cache.get(did)
+            if (
+                report is None
+                or report.status is not cached
+                or report.device is not device_info
+            ):
+                report = CleverSpaDeviceReport(device_info, cached)
+                self._local_report_cache[did] = report
+
+            results[did] = report
 
         return results
 
-    async def set_heat(self, device_id: str, heat: bool) -> None:
+    async def set_heat(self, device_id: str, heat: bool) -> CleverSpaDeviceStatus:
         """
         Turn the heater on/off.
         Turning the heater on will also turn on the filter pump.
         """
         _LOGGER.debug("Setting heater mode to %s", "ON" if heat else "OFF")
-        headers = dict(_HEADERS)
-        headers["X-Gizwits-User-token"] = self._user_token
-        await self._do_post(
-            f"{self._api_root}/app/control/{device_id}",
-            headers,
-            {"attrs": {"Heater": 1 if heat else 0}},
-        )
-        self._local_state_cache[device_id].timestamp = int(time())
-        self._local_state_cache[device_id].heat_power = heat
-        if heat:
-            self._local_state_cache[device_id].filter_power = True
-            await self.fetch_data()
-        else:
-            await self.fetch_data()
-            # TODO: Filter cooldown for 30 seconds. This also needs to add some kind of
-            # blocking for turning off the filter if it's in cooldown
-            await asyncio.sleep(30)
-            await self.set_filter(self._local_state_cache[device_id], False)
-
-
-    async def set_filter(self, device_id: str, filtering: bool) -> None:
+        async with self._device_lock(device_id):
+            await self._do_post(
+                f"{self._api_root}/app/control/{device_id}",
+                self._auth_headers,
+                {"attrs": {"Heater": 1 if heat else 0}},
+            )
+            status = self._local_state_cache[device_id]
+            if heat:
+                self._local_state_cache[device_id] = replace(
+                    status, timestamp=int(time()), heat_power=True, filter_power=True
+                )
+            else:
+                self._local_state_cache[device_id] = replace(
+                    status, timestamp=int(time()), heat_power=False
+                )
+                # The filter needs to keep running for a cooldown period after
+                # the heater is switched off. Run it in the background so the
+                # user action returns immediately.
+                # TODO: This also needs to add some kind of blocking for turning
+                # off the filter if it's in cooldown
+                asyncio.create_task(self._filter_cooldown(device_id))
+            return self._local_state_cache[device_id]
+
+    async def _filter_cooldown(self, device_id: str) -> None:
+        """Turn the filter pump off once the post-heat cooldown has elapsed."""
+        await asyncio.sleep(COOLDOWN_TIME)
+        await self.set_filter(device_id, False)
+
+
+    async def set_filter(self, device_id: str, filtering: bool) -> CleverSpaDeviceStatus:
         """Turn the filter pump on/off."""
         _LOGGER.debug("Setting filter mode to %s", "ON" if filtering else "OFF")
-        headers = dict(_HEADERS)
-        headers["X-Gizwits-User-token"] = self._user_token
-        await self._do_post(
-            f"{self._api_root}/app/control/{device_id}",
-            headers,
-            {"attrs": {"Filter": 1 if filtering else 0}},
-        )
-        self._local_state_cache[device_id].timestamp = int(time())
-        self._local_state_cache[device_id].filter_power = filtering
-        if not filtering:
-            self._local_state_cache[device_id].wave_power = False
-            self._local_state_cache[device_id].heat_power = False
+        async with self._device_lock(device_id):
+            await self._do_post(
+                f"{self._api_root}/app/control/{device_id}",
+                self._auth_headers,
+                {"attrs": {"Filter": 1 if filtering else 0}},
+            )
+            status = self._local_state_cache[device_id]
+            if filtering:
+                self._local_state_cache[device_id] = replace(
+                    status, timestamp=int(time()), filter_power=True
+                )
+            else:
+                # Stopping the filter pump also stops the heater
+                self._local_state_cache[device_id] = replace(
+                    status, timestamp=int(time()), filter_power=False, heat_power=False
+                )
 
-    async def set_locked(self, device_id: str, locked: bool) -> None:
+            return self._local_state_cache[device_id]
+
+    async def set_locked(self, device_id: str, locked: bool) -> CleverSpaDeviceStatus:
         """Lock or unlock the physical control panel."""
         _LOGGER.debug("Setting lock state to %s", "ON" if locked else "OFF")
-        headers = dict(_HEADERS)
-        headers["X-Gizwits-User-token"] = self._user_token
-        await self._do_post(
-            f"{self._api_root}/app/control/{device_id}",
-            headers,
-            {"attrs": {"locked": 1 if locked else 0}},
-        )
-        self._local_state_cache[device_id].timestamp = int(time())
-        self._local_state_cache[device_id].locked = locked
-        await self.fetch_data()
+        async with self._device_lock(device_id):
+            await self._do_post(
+                f"{self._api_root}/app/control/{device_id}",
+                self._auth_headers,
+                {"attrs": {"locked": 1 if locked else 0}},
+            )
+            status = self._local_state_cache[device_id]
+            self._local_state_cache[device_id] = replace(
+                status, timestamp=int(time()), locked=locked
+            )
 
-    async def set_bubbles(self, device_id: str, bubbles: bool) -> None:
+            return self._local_state_cache[device_id]
+
+    async def set_bubbles(self, device_id: str, bubbles: bool) -> CleverSpaDeviceStatus:
         """Turn the bubbles on/off."""
         _LOGGER.debug("Setting bubbles mode to %s", "ON" if bubbles else "OFF")
-        headers = dict(_HEADERS)
-        headers["X-Gizwits-User-token"] = self._user_token
-        await self._do_post(
-            f"{self._api_root}/app/control/{device_id}",
-            headers,
-            {"attrs": {"Bubble": 1 if bubbles else 0}},
-        )
-        self._local_state_cache[device_id].timestamp = int(time())
-        self._local_state_cache[device_id].filter_power = bubbles
-        if bubbles:
-            self._local_state_cache[device_id].filter_power = True
-        await self.fetch_data()
+        async with self._device_lock(device_id):
+            await self._do_post(
+                f"{self._api_root}/app/control/{device_id}",
+                self._auth_headers,
+                {"attrs": {"Bubble": 1 if bubbles else 0}},
+            )
+            status = self._local_state_cache[device_id]
+            self._local_state_cache[device_id] = replace(
+                status,
+                timestamp=int(time()),
+                bubble_power=bubbles,
+                # Turning the bubbles on also turns on the filter pump
+                filter_power=True if bubbles else status.filter_power,
+            )
+
+            return self._local_state_cache[device_id]
 
-    async def set_target_temp(self, device_id: str, target_temp: int) -> None:
+    async def set_target_temp(self, device_id: str, target_temp: int) -> CleverSpaDeviceStatus:
         """Set the target temperature."""
         _LOGGER.debug("Setting target temperature to %d", target_temp)
-        headers = dict(_HEADERS)
-        headers["X-Gizwits-User-token"] = self._user_token
-        await self._do_post(
-            f"{self._api_root}/app/control/{device_id}",
-            headers,
-            {"attrs": {"Temperature_setup": target_temp}},
-        )
-        self._local_state_cache[device_id].timestamp = int(time())
-        self._local_state_cache[device_id].temp_set = target_temp
-        await self.fetch_data()
+        async with self._device_lock(device_id):
+            await self._do_post(
+                f"{self._api_root}/app/control/{device_id}",
+                self._auth_headers,
+                {"attrs": {"Temperature_setup": target_temp}},
+            )
+            status = self._local_state_cache[device_id]
+            self._local_state_cache[device_id] = replace(
+                status, timestamp=int(time()), temp_set=target_temp
+            )
+
+            return self._local_state_cache[device_id]
+
+    async def set_state(self, device_id: str, **fields: Any) -> CleverSpaDeviceStatus:
+        """
+        Apply several settings for a device in a single control call.
+        Keyword names match the CleverSpaDeviceStatus fields.
+        """
+        _LOGGER.debug("Setting state for device %s: %s", device_id, fields)
+        attrs = {
+            _CONTROL_ATTRS[field]: value if field == "temp_set" else 1 if value else 0
+            for field, value in fields.items()
+        }
+        async with self._device_lock(device_id):
+            await self._do_post(
+                f"{self._api_root}/app/control/{device_id}",
+                self._auth_headers,
+                {"attrs": attrs},
+            )
+            # Mirror the side effects applied by the individual setters
+            if fields.get("heat_power") or fields.get("bubble_power"):
+                fields.setdefault("filter_power", True)
+            if fields.get("filter_power") is False:
+                fields.setdefault("heat_power", False)
+            status = self._local_state_cache[device_id]
+            self._local_state_cache[device_id] = replace(
+                status, timestamp=int(time()), **fields
+            )
+            return self._local_state_cache[device_id]
 
     async def _do_get(self, url: str, headers: dict[str, str]) -> dict[str, Any]:
         """Make an API call to the specified URL, returning the response as a JSON object."""
@@ -366,7 +463,9 @@ class CleverSpaApi:
             # All API responses are encoded using JSON, however the headers often incorrectly
             # state 'text/html' as the content type.
             # We have to disable the check to avoid an exception.
-            response_json: dict[str, Any] = await response.json(content_type=None)
+            response_json: dict[str, Any] = await response.json(
+                loads=orjson.loads, content_type=None
+            )
             return response_json
 
     async def _do_post(
@@ -380,5 +479,7 @@ class CleverSpaApi:
             # All API responses are encoded using JSON, however the headers often incorrectly
             # state 'text/html' as the content type.
             # We have to disable the check to avoid an exception.
-            response_json: dict[str, Any] = await response.json(content_type=None)
+            response_json: dict[str, Any] = await response.json(
+                loads=orjson.loads, content_type=None
+            )
             return response_json
\ No newline at end of file
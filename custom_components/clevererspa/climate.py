@@ -1,22 +1,17 @@
 """Climate platform support."""
 from __future__ import annotations
 
+import sys
 from typing import Any
 
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
 from homeassistant.components.climate.const import HVACAction, HVACMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    ATTR_TEMPERATURE,
-    PRECISION_WHOLE,
-    TEMP_CELSIUS,
-    TEMP_FAHRENHEIT,
-)
+from homeassistant.const import ATTR_TEMPERATURE, PRECISION_WHOLE, TEMP_CELSIUS
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from . import CleverSpaUpdateCoordinator
-from .clevererspa import TemperatureUnit
 from .const import DOMAIN
 from .entity import CleverSpaEntity
 
@@ -43,6 +38,9 @@ class CleverSpaThermostat(CleverSpaEntity, ClimateEntity):
     _attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
     _attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
     _attr_precision = PRECISION_WHOLE
+    # The API always reports Celsius, so resolve the unit once here rather
+    # than branching on the status in a property read
+    _attr_temperature_unit = TEMP_CELSIUS
     _attr_target_temperature_step = 1
     _attr_max_temp = 40
     _attr_min_temp = 20
@@ -55,7 +53,8 @@ class CleverSpaThermostat(CleverSpaEntity, ClimateEntity):
     ) -> None:
         """Initialize thermostat."""
         super().__init__(coordinator, config_entry, device_id)
-        self._attr_unique_id = f"{device_id}_thermostat"
+        self._attr_unique_id = sys.intern(f"{device_id}_thermostat")
+        self._api = coordinator.api
 
     @property
     def hvac_mode(self) -> HVACMode | str | None:
@@ -93,22 +92,11 @@ class CleverSpaThermostat(CleverSpaEntity, ClimateEntity):
             return None
         return self.device_status.temp_set
 
-    @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement used by the platform."""
-        if (
-            not self.device_status
-            or self.device_status.temp_set_unit == TemperatureUnit.CELSIUS
-        ):
-            return str(TEMP_CELSIUS)
-        else:
-            return str(TEMP_FAHRENHEIT)
-
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         should_heat = True if hvac_mode == HVACMode.HEAT else False
-        await self.coordinator.api.set_heat(self.device_id, should_heat)
-        await self.coordinator.async_refresh()
+        await self._api.set_heat(self.device_id, should_heat)
+        await self.coordinator.async_request_refresh()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set a new target temperature."""
@@ -116,5 +104,5 @@ class CleverSpaThermostat(CleverSpaEntity, ClimateEntity):
         if target_temperature is None:
             return
 
-        await self.coordinator.api.set_target_temp(self.device_id, target_temperature)
-        await self.coordinator.async_refresh()
\ No newline at end of file
+        await self._api.set_target_temp(self.device_id, target_temperature)
+        await self.coordinator.async_request_refresh()
\ No newline at end of file
@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import CleverSpaUpdateCoordinator
-from .clevererspa import CleverSpaDevice, CleverSpaDeviceReport, CleverSpaDeviceStatus
+from .clevererspa import CleverSpaDevice, CleverSpaDeviceStatus
 from .const import DOMAIN
 
 
@@ -24,11 +25,27 @@ class CleverSpaEntity(CoordinatorEntity[CleverSpaUpdateCoordinator]):
         self.config_entry = config_entry
         self.device_id = device_id
 
+        # The coordinator updates this dict in place, so holding a reference
+        # here saves walking coordinator.data on every property read.
+        self._status_by_id = coordinator.status_by_id
+
+        # Status resolved once per update cycle; properties are read far more
+        # often than the coordinator refreshes.
+        entry = self._status_by_id.get(device_id)
+        self._cached_status = entry[1] if entry else None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Re-resolve the cached device status when new data arrives."""
+        entry = self._status_by_id.get(self.device_id)
+        self._cached_status = entry[1] if entry else None
+        super()._handle_coordinator_update()
+
     @property
     def device_info(self) -> DeviceInfo:
         """Device information for the spa providing this entity."""
 
-        device_info: CleverSpaDevice = self.coordinator.data[self.device_id].device
+        device_info: CleverSpaDevice = self._status_by_id[self.device_id][0]
 
         return DeviceInfo(
             identifiers={(DOMAIN, self.device_id)},
@@ -40,10 +57,7 @@ class CleverSpaEntity(CoordinatorEntity[CleverSpaUpdateCoordinator]):
     @property
     def device_status(self) -> CleverSpaDeviceStatus | None:
         """Get status data for the spa providing this entity."""
-        device_report: CleverSpaDeviceReport = self.coordinator.data.get(self.device_id)
-        if device_report:
-            return device_report.status
-        return None
+        return self._cached_status
 
     @property
     def available(self) -> bool:
@@ -1,17 +1,18 @@
 """Switch platform support."""
 from __future__ import annotations
 
-from collections.abc import Callable
+import sys
+
 from dataclasses import dataclass
-from typing import Any, Awaitable
+from itertools import product
+from operator import attrgetter
+from typing import Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from custom_components.clevererspa.clevererspa import CleverSpaApi, CleverSpaDeviceStatus
-
 from . import CleverSpaUpdateCoordinator
 from .const import DOMAIN
 from .entity import CleverSpaEntity
@@ -21,9 +22,7 @@ from .entity import CleverSpaEntity
 class RequiredKeysMixin:
     """Mixin for required keys."""
 
-    value_fn: Callable[[CleverSpaDeviceStatus], bool]
-    turn_on_fn: Callable[[CleverSpaApi, str], Awaitable[None]]
-    turn_off_fn: Callable[[CleverSpaApi, str], Awaitable[None]]
+    value_attr: str
 
 
 @dataclass
@@ -31,33 +30,20 @@ class CleverSpaSwitchEntityDescription(SwitchEntityDescription, RequiredKeysMixi
     """Entity description for CleverSpa switches."""
 
 
-_SENSOR_TYPES = [
+_SENSOR_TYPES = (
     CleverSpaSwitchEntityDescription(
         key="filter_power",
         name="Spa Filter",
         icon="mdi:air-filter",
-        value_fn=lambda s: s.filter_power,
-        turn_on_fn=lambda api, device_id: api.set_filter(device_id, True),
-        turn_off_fn=lambda api, device_id: api.set_filter(device_id, False),
+        value_attr="filter_power",
     ),
     CleverSpaSwitchEntityDescription(
         key="bubble_power",
         name="Spa Bubbles",
         icon="mdi:chart-bubble",
-        value_fn=lambda s: s.bubble_power,
-        turn_on_fn=lambda api, device_id: api.set_bubbles(device_id, True),
-        turn_off_fn=lambda api, device_id: api.set_bubbles(device_id, False),
+        value_attr="bubble_power",
     ),
-    #CleverSpaSwitchEntityDescription(
-    #    key="wave_locked",
-    #    name="Spa Locked",
-    #    icon="mdi:lock",
-    #    value_fn=lambda s: s.locked,
-    #    turn_on_fn=lambda api, device_id: api.set_locked(device_id, True),
-    #    turn_off_fn=lambda api, device_id: api.set_locked(device_id, False),
-    #),
-
-]
+)
 
 
 async def async_setup_entry(
@@ -68,10 +54,16 @@ async def async_setup_entry(
     """Set up switch entities."""
     coordinator: CleverSpaUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
 
+    device_ids = tuple(coordinator.data)
     entities = [
-        CleverSpaSwitch(coordinator, config_entry, device_id, description)
-        for device_id in coordinator.data.keys()
-        for description in _SENSOR_TYPES
+        CleverSpaSwitch(
+            coordinator,
+            config_entry,
+            device_id,
+            description,
+            sys.intern(f"{device_id}_{description.key}"),
+        )
+        for device_id, description in product(device_ids, _SENSOR_TYPES)
     ]
     async_add_entities(entities)
 
@@ -79,6 +71,8 @@ async def async_setup_entry(
 class CleverSpaSwitch(CleverSpaEntity, SwitchEntity):
     """CleverSpa switch entity."""
 
+    __slots__ = ("entity_description", "_getter")
+
     entity_description: CleverSpaSwitchEntityDescription
 
     def __init__(
@@ -87,26 +81,31 @@ class CleverSpaSwitch(CleverSpaEntity, SwitchEntity):
         config_entry: ConfigEntry,
         device_id: str,
         description: CleverSpaSwitchEntityDescription,
+        unique_id: str,
     ) -> None:
         """Initialize switch."""
         super().__init__(coordinator, config_entry, device_id)
         self.entity_description = description
-        self._attr_unique_id = f"{device_id}_{description.key}"
+        self._attr_unique_id = unique_id
+        self._getter = attrgetter(description.value_attr)
 
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        if not self.device_status:
+        status = self.device_status
+        if status is None:
             return None
 
-        return self.entity_description.value_fn(self.device_status)
+        return self._getter(status)
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
-        await self.entity_description.turn_on_fn(self.coordinator.api, self.device_id)
-        await self.coordinator.async_refresh()
+        self.coordinator.queue_write(
+            self.device_id, self.entity_description.value_attr, True
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
-        await self.entity_description.turn_off_fn(self.coordinator.api, self.device_id)
-        await self.coordinator.async_refresh()
\ No newline at end of file
+        self.coordinator.queue_write(
+            self.device_id, self.entity_description.value_attr, False
+        )
\ No newline at end of file